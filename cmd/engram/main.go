@@ -37,6 +37,7 @@ var (
 	storeNew      = store.New
 	newHTTPServer = server.New
 	startHTTP     = (*server.Server).Start
+	setHTTPSocket = (*server.Server).SetSocket
 
 	newMCPServer          = mcp.NewServer
 	newMCPServerWithTools = mcp.NewServerWithTools
@@ -147,6 +148,10 @@ func cmdServe(cfg store.Config) {
 	defer s.Close()
 
 	srv := newHTTPServer(s, port)
+	// Optionally also serve on a Unix socket so local hooks can skip TCP
+	if sock := os.Getenv("ENGRAM_SOCKET"); sock != "" {
+		setHTTPSocket(srv, sock)
+	}
 	if err := startHTTP(srv); err != nil {
 		fatal(err)
 	}
@@ -759,6 +764,7 @@ Commands:
 Environment:
   ENGRAM_DATA_DIR    Override data directory (default: ~/.engram)
   ENGRAM_PORT        Override HTTP server port (default: 7437)
+  ENGRAM_SOCKET      Also serve the HTTP API on this Unix socket path (serve only)
 
 MCP Configuration (add to your agent's config):
   {
@@ -77,6 +77,7 @@ func stubRuntimeHooks(t *testing.T) {
 	oldStoreNew := storeNew
 	oldNewHTTPServer := newHTTPServer
 	oldStartHTTP := startHTTP
+	oldSetHTTPSocket := setHTTPSocket
 	oldNewMCPServer := newMCPServer
 	oldNewMCPServerWithTools := newMCPServerWithTools
 	oldServeMCP := serveMCP
@@ -140,6 +141,7 @@ func stubRuntimeHooks(t *testing.T) {
 		storeNew = oldStoreNew
 		newHTTPServer = oldNewHTTPServer
 		startHTTP = oldStartHTTP
+		setHTTPSocket = oldSetHTTPSocket
 		newMCPServer = oldNewMCPServer
 		newMCPServerWithTools = oldNewMCPServerWithTools
 		serveMCP = oldServeMCP
@@ -182,14 +184,17 @@ func TestCmdServeParsesPortAndErrors(t *testing.T) {
 	stubRuntimeHooks(t)
 
 	tests := []struct {
-		name      string
-		envPort   string
-		argPort   string
-		wantPort  int
-		startErr  error
-		wantFatal bool
+		name       string
+		envPort    string
+		argPort    string
+		envSocket  string
+		wantPort   int
+		wantSocket string
+		startErr   error
+		wantFatal  bool
 	}{
 		{name: "default port", wantPort: 7437},
+		{name: "socket env", envSocket: "/tmp/engram.sock", wantPort: 7437, wantSocket: "/tmp/engram.sock"},
 		{name: "env port", envPort: "8123", wantPort: 8123},
 		{name: "arg overrides env", envPort: "8123", argPort: "9001", wantPort: 9001},
 		{name: "invalid env keeps default", envPort: "nope", wantPort: 7437},
@@ -205,6 +210,7 @@ func TestCmdServeParsesPortAndErrors(t *testing.T) {
 			} else {
 				t.Setenv("ENGRAM_PORT", "")
 			}
+			t.Setenv("ENGRAM_SOCKET", tc.envSocket)
 
 			args := []string{"engram", "serve"}
 			if tc.argPort != "" {
@@ -220,6 +226,10 @@ func TestCmdServeParsesPortAndErrors(t *testing.T) {
 			startHTTP = func(_ *engramsrv.Server) error {
 				return tc.startErr
 			}
+			seenSocket := ""
+			setHTTPSocket = func(_ *engramsrv.Server, path string) {
+				seenSocket = path
+			}
 
 			_, stderr, recovered := captureOutputAndRecover(t, func() {
 				cmdServe(cfg)
@@ -228,6 +238,9 @@ func TestCmdServeParsesPortAndErrors(t *testing.T) {
 			if seenPort != tc.wantPort {
 				t.Fatalf("port=%d want=%d", seenPort, tc.wantPort)
 			}
+			if seenSocket != tc.wantSocket {
+				t.Fatalf("socket=%q want=%q", seenSocket, tc.wantSocket)
+			}
 			if tc.wantFatal {
 				if _, ok := recovered.(exitCode); !ok {
 					t.Fatalf("expected fatal exit, got %v", recovered)
@@ -11,6 +11,7 @@ import (
 	"log"
 	"net"
 	"net/http"
+	"os"
 	"strconv"
 
 	"github.com/Gentleman-Programming/engram/internal/store"
@@ -24,6 +25,7 @@ type Server struct {
 	store  *store.Store
 	mux    *http.ServeMux
 	port   int
+	socket string // optional Unix domain socket path, served alongside TCP
 	listen func(network, address string) (net.Listener, error)
 	serve  func(net.Listener, http.Handler) error
 }
@@ -35,6 +37,12 @@ func New(s *store.Store, port int) *Server {
 	return srv
 }
 
+// SetSocket makes Start also serve the API on a Unix domain socket at path.
+// Local clients (e.g. the Claude Code hooks) can then skip TCP entirely.
+func (s *Server) SetSocket(path string) {
+	s.socket = path
+}
+
 func (s *Server) Start() error {
 	addr := fmt.Sprintf("127.0.0.1:%d", s.port)
 	listenFn := s.listen
@@ -51,9 +59,48 @@ func (s *Server) Start() error {
 		return fmt.Errorf("engram server: listen %s: %w", addr, err)
 	}
 	log.Printf("[engram] HTTP server listening on %s", addr)
+
+	// The socket is claimed only after the TCP port, so a second server that
+	// loses the port never unlinks the socket of the one already running.
+	if s.socket != "" {
+		if err := removeStaleSocket(s.socket); err != nil {
+			ln.Close()
+			return fmt.Errorf("engram server: %w", err)
+		}
+		unixLn, err := listenFn("unix", s.socket)
+		if err != nil {
+			ln.Close()
+			return fmt.Errorf("engram server: listen %s: %w", s.socket, err)
+		}
+		defer unixLn.Close()
+		log.Printf("[engram] HTTP server listening on unix:%s", s.socket)
+		go func() {
+			if err := serveFn(unixLn, s.mux); err != nil {
+				log.Printf("[engram] unix socket server stopped: %v", err)
+			}
+		}()
+	}
+
 	return serveFn(ln, s.mux)
 }
 
+// removeStaleSocket deletes a socket file left at path by a previous run,
+// which would otherwise make listen fail. Anything else at path is left in
+// place and reported, so a mistyped ENGRAM_SOCKET never deletes a real file.
+func removeStaleSocket(path string) error {
+	fi, err := os.Lstat(path)
+	if err != nil {
+		if os.IsNotExist(err) {
+			return nil
+		}
+		return fmt.Errorf("stat socket %s: %w", path, err)
+	}
+	if fi.Mode()&os.ModeSocket == 0 {
+		return fmt.Errorf("socket path %s exists and is not a socket", path)
+	}
+	return os.Remove(path)
+}
+
 func (s *Server) Handler() http.Handler {
 	return s.mux
 }
@@ -7,6 +7,8 @@ import (
 	"net"
 	"net/http"
 	"net/http/httptest"
+	"os"
+	"path/filepath"
 	"strings"
 	"testing"
 
@@ -19,6 +21,16 @@ func (stubListener) Accept() (net.Conn, error) { return nil, errors.New("not use
 func (stubListener) Close() error              { return nil }
 func (stubListener) Addr() net.Addr            { return &net.TCPAddr{} }
 
+type closeTrackingListener struct {
+	stubListener
+	closed bool
+}
+
+func (l *closeTrackingListener) Close() error {
+	l.closed = true
+	return nil
+}
+
 func TestStartReturnsListenError(t *testing.T) {
 	s := New(nil, 7777)
 	s.listen = func(network, address string) (net.Listener, error) {
@@ -49,6 +61,113 @@ func TestStartUsesInjectedServe(t *testing.T) {
 	}
 }
 
+func TestStartAlsoListensOnUnixSocket(t *testing.T) {
+	sock := filepath.Join(t.TempDir(), "engram.sock")
+	s := New(&store.Store{}, 7777)
+	s.SetSocket(sock)
+
+	var networks []string
+	unixLn := &closeTrackingListener{}
+	s.listen = func(network, address string) (net.Listener, error) {
+		networks = append(networks, network+":"+address)
+		if network == "unix" {
+			return unixLn, nil
+		}
+		return stubListener{}, nil
+	}
+	s.serve = func(ln net.Listener, h http.Handler) error {
+		return errors.New("serve stopped")
+	}
+
+	err := s.Start()
+	if err == nil || err.Error() != "serve stopped" {
+		t.Fatalf("expected propagated serve error, got %v", err)
+	}
+	if len(networks) != 2 || networks[0] != "tcp:127.0.0.1:7777" || networks[1] != "unix:"+sock {
+		t.Fatalf("expected tcp then unix listeners, got %v", networks)
+	}
+	if !unixLn.closed {
+		t.Fatalf("expected unix listener to be closed when serving stops")
+	}
+}
+
+func TestStartReturnsUnixSocketListenError(t *testing.T) {
+	s := New(&store.Store{}, 7777)
+	s.SetSocket(filepath.Join(t.TempDir(), "engram.sock"))
+	tcpLn := &closeTrackingListener{}
+	s.listen = func(network, address string) (net.Listener, error) {
+		if network == "unix" {
+			return nil, errors.New("unix listen failed")
+		}
+		return tcpLn, nil
+	}
+
+	err := s.Start()
+	if err == nil || !strings.Contains(err.Error(), "unix listen failed") {
+		t.Fatalf("expected unix listen error, got %v", err)
+	}
+	if !tcpLn.closed {
+		t.Fatalf("expected tcp listener to be closed after unix listen error")
+	}
+}
+
+func TestStartLeavesSocketAloneWhenTCPListenFails(t *testing.T) {
+	sock := filepath.Join(t.TempDir(), "engram.sock")
+	if err := os.WriteFile(sock, nil, 0o600); err != nil {
+		t.Fatalf("write socket placeholder: %v", err)
+	}
+
+	s := New(&store.Store{}, 7777)
+	s.SetSocket(sock)
+	unixListened := false
+	s.listen = func(network, address string) (net.Listener, error) {
+		if network == "unix" {
+			unixListened = true
+			return stubListener{}, nil
+		}
+		return nil, errors.New("address already in use")
+	}
+
+	err := s.Start()
+	if err == nil || !strings.Contains(err.Error(), "address already in use") {
+		t.Fatalf("expected tcp listen error, got %v", err)
+	}
+	if unixListened {
+		t.Fatalf("expected unix socket not to be claimed when the tcp port is taken")
+	}
+	if _, err := os.Stat(sock); err != nil {
+		t.Fatalf("expected running server's socket to be left in place: %v", err)
+	}
+}
+
+func TestStartRefusesToRemoveNonSocketAtSocketPath(t *testing.T) {
+	path := filepath.Join(t.TempDir(), "engram.db")
+	if err := os.WriteFile(path, []byte("data"), 0o600); err != nil {
+		t.Fatalf("write file: %v", err)
+	}
+
+	s := New(&store.Store{}, 7777)
+	s.SetSocket(path)
+	tcpLn := &closeTrackingListener{}
+	s.listen = func(network, address string) (net.Listener, error) {
+		if network == "unix" {
+			t.Fatalf("expected no unix listen over a regular file")
+		}
+		return tcpLn, nil
+	}
+
+	err := s.Start()
+	if err == nil || !strings.Contains(err.Error(), "not a socket") {
+		t.Fatalf("expected not-a-socket error, got %v", err)
+	}
+	if !tcpLn.closed {
+		t.Fatalf("expected tcp listener to be closed")
+	}
+	if data, err := os.ReadFile(path); err != nil || string(data) != "data" {
+		t.Fatalf("expected file to be left in place, got %q, %v", data, err)
+	}
+}
+
 func newServerTestStore(t *testing.T) *store.Store {
 	t.Helper()
 	cfg := store.DefaultConfig()
@@ -300,9 +300,17 @@ export const Engram: Plugin = async (ctx) => {
         toolCounts.set(sessionId, (toolCounts.get(sessionId) ?? 0) + 1)
       }
 
-      // Passive capture: extract learnings from Task tool output
+      // Passive capture: extract learnings from Task tool output.
+      // Prefer the plain-text output field — stringifying the whole result
+      // would serialize its (potentially large) metadata and escape the
+      // newlines the server's line-anchored header matching relies on.
       if (input.tool === "Task" && output && sessionId) {
-        const text = typeof output === "string" ? output : JSON.stringify(output)
+        const text =
+          typeof output === "string"
+            ? output
+            : typeof (output as any).output === "string"
+              ? (output as any).output
+              : JSON.stringify(output)
         if (text.length > 50) {
           await engramFetch("/observations/passive", {
             method: "POST",
@@ -186,6 +186,17 @@ type queryer interface {
 	Query(query string, args ...any) (*sql.Rows, error)
 }
 
+type rowQueryer interface {
+	QueryRow(query string, args ...any) *sql.Row
+}
+
+// observationWriter is satisfied by both *sql.DB and *sql.Tx so observation
+// writes can run standalone or as part of a larger transaction.
+type observationWriter interface {
+	execer
+	rowQueryer
+}
+
 type rowScanner interface {
 	Next() bool
 	Scan(dest ...any) error
@@ -672,6 +683,10 @@ func (s *Store) SessionObservations(sessionID string, limit int) ([]Observation,
 // ─── Observations ────────────────────────────────────────────────────────────
 
 func (s *Store) AddObservation(p AddObservationParams) (int64, error) {
+	return s.addObservation(s.db, p)
+}
+
+func (s *Store) addObservation(db observationWriter, p AddObservationParams) (int64, error) {
 	// Strip <private>...</private> tags before persisting ANYTHING
 	title := stripPrivateTags(p.Title)
 	content := stripPrivateTags(p.Content)
@@ -685,7 +700,7 @@ func (s *Store) AddObservation(p AddObservationParams) (int64, error) {
 
 	if topicKey != "" {
 		var existingID int64
-		err := s.db.QueryRow(
+		err := db.QueryRow(
 			`SELECT id FROM observations
 			 WHERE topic_key = ?
 			   AND ifnull(project, '') = ifnull(?, '')
@@ -696,7 +711,7 @@ func (s *Store) AddObservation(p AddObservationParams) (int64, error) {
 			topicKey, nullableString(p.Project), scope,
 		).Scan(&existingID)
 		if err == nil {
-			if _, err := s.execHook(s.db,
+			if _, err := s.execHook(db,
 				`UPDATE observations
 				 SET type = ?,
 				     title = ?,
@@ -727,7 +742,7 @@ func (s *Store) AddObservation(p AddObservationParams) (int64, error) {
 
 	window := dedupeWindowExpression(s.cfg.DedupeWindow)
 	var existingID int64
-	err := s.db.QueryRow(
+	err := db.QueryRow(
 		`SELECT id FROM observations
 		 WHERE normalized_hash = ?
 		   AND ifnull(project, '') = ifnull(?, '')
@@ -741,7 +756,7 @@ func (s *Store) AddObservation(p AddObservationParams) (int64, error) {
 		normHash, nullableString(p.Project), scope, p.Type, title, window,
 	).Scan(&existingID)
 	if err == nil {
-		if _, err := s.execHook(s.db,
+		if _, err := s.execHook(db,
 			`UPDATE observations
 			 SET duplicate_count = duplicate_count + 1,
 			     last_seen_at = datetime('now'),
@@ -757,7 +772,7 @@ func (s *Store) AddObservation(p AddObservationParams) (int64, error) {
 		return 0, err
 	}
 
-	res, err := s.execHook(s.db,
+	res, err := s.execHook(db,
 		`INSERT INTO observations (session_id, type, title, content, tool_name, project, scope, topic_key, normalized_hash, revision_count, duplicate_count, last_seen_at, updated_at)
 		 VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, 1, 1, datetime('now'), datetime('now'))`,
 		p.SessionID, p.Type, title, content,
@@ -1662,6 +1677,21 @@ func SuggestTopicKey(typ, title, content string) string {
 	return family + "/" + segment
 }
 
+// topicFamilyKeywords maps free-text keywords to topic families, checked in
+// order when the observation type alone does not determine the family.
+var topicFamilyKeywords = []struct {
+	family string
+	words  []string
+}{
+	{"bug", []string{"bug", "fix", "panic", "error", "crash", "regression", "incident", "hotfix"}},
+	{"architecture", []string{"architecture", "design", "adr", "boundary", "hexagonal", "refactor"}},
+	{"decision", []string{"decision", "tradeoff", "chose", "choose", "decide"}},
+	{"pattern", []string{"pattern", "convention", "naming", "guideline"}},
+	{"config", []string{"config", "setup", "environment", "env", "docker", "pipeline"}},
+	{"discovery", []string{"discovery", "investigate", "investigation", "found", "root cause"}},
+	{"learning", []string{"learned", "learning"}},
+}
+
 func inferTopicFamily(typ, title, content string) string {
 	t := strings.TrimSpace(strings.ToLower(typ))
 	switch t {
@@ -1684,26 +1714,10 @@ func inferTopicFamily(typ, title, content string) string {
 	}
 
 	text := strings.ToLower(title + " " + content)
-	if hasAny(text, "bug", "fix", "panic", "error", "crash", "regression", "incident", "hotfix") {
-		return "bug"
-	}
-	if hasAny(text, "architecture", "design", "adr", "boundary", "hexagonal", "refactor") {
-		return "architecture"
-	}
-	if hasAny(text, "decision", "tradeoff", "chose", "choose", "decide") {
-		return "decision"
-	}
-	if hasAny(text, "pattern", "convention", "naming", "guideline") {
-		return "pattern"
-	}
-	if hasAny(text, "config", "setup", "environment", "env", "docker", "pipeline") {
-		return "config"
-	}
-	if hasAny(text, "discovery", "investigate", "investigation", "found", "root cause") {
-		return "discovery"
-	}
-	if hasAny(text, "learned", "learning") {
-		return "learning"
+	for _, kw := range topicFamilyKeywords {
+		if hasAny(text, kw.words...) {
+			return kw.family
+		}
 	}
 
 	if t != "" && t != "manual" {
@@ -1722,13 +1736,15 @@ func hasAny(text string, words ...string) bool {
 	return false
 }
 
+// topicSegmentSeparator matches runs of characters not allowed in a topic segment.
+var topicSegmentSeparator = regexp.MustCompile(`[^a-z0-9]+`)
+
 func normalizeTopicSegment(s string) string {
 	v := strings.ToLower(strings.TrimSpace(s))
 	if v == "" {
 		return ""
 	}
-	re := regexp.MustCompile(`[^a-z0-9]+`)
-	v = re.ReplaceAllString(v, " ")
+	v = topicSegmentSeparator.ReplaceAllString(v, " ")
 	v = strings.Join(strings.Fields(v), "-")
 	if len(v) > 100 {
 		v = v[:100]
@@ -1787,12 +1803,33 @@ var privateTagRegex = regexp.MustCompile(`(?is)<private>.*?</private>`)
 // This ensures sensitive information (API keys, passwords, personal data)
 // is never persisted to the memory database.
 func stripPrivateTags(s string) string {
-	result := privateTagRegex.ReplaceAllString(s, "[REDACTED]")
+	result := s
+	if hasPrivateTag(s) {
+		result = privateTagRegex.ReplaceAllString(s, "[REDACTED]")
+	}
 	// Clean up multiple consecutive [REDACTED] and excessive whitespace
 	result = strings.TrimSpace(result)
 	return result
 }
 
+// hasPrivateTag reports whether s contains an opening <private> tag (any case).
+// Most content has none, and ReplaceAllString always copies its input, so
+// stripPrivateTags only runs the regex when this cheap scan finds a tag.
+func hasPrivateTag(s string) bool {
+	const tag = "<private>"
+	for i := 0; i+len(tag) <= len(s); i++ {
+		j := strings.IndexByte(s[i:], '<')
+		if j < 0 {
+			return false
+		}
+		i += j
+		if i+len(tag) <= len(s) && strings.EqualFold(s[i:i+len(tag)], tag) {
+			return true
+		}
+	}
+	return false
+}
+
 // sanitizeFTS wraps each word in quotes so FTS5 doesn't choke on special chars.
 // "fix auth bug" → `"fix" "auth" "bug"`
 func sanitizeFTS(query string) string {
@@ -1827,71 +1864,186 @@ var learningHeaderPattern = regexp.MustCompile(
 	`(?im)^#{2,3}\s+(?:Aprendizajes(?:\s+Clave)?|Key\s+Learnings?|Learnings?):?\s*$`,
 )
 
+// numberedItemPattern matches numbered list items: "1. text" or "1) text".
+var numberedItemPattern = regexp.MustCompile(`(?m)^\s*\d+[.)]\s+(.+)`)
+
+// bulletItemPattern matches bullet list items: "- text" or "* text".
+var bulletItemPattern = regexp.MustCompile(`(?m)^\s*[-*]\s+(.+)`)
+
+// Markdown patterns stripped by cleanMarkdown. They run in this order, each
+// over the previous one's output, so a span nested inside another one (e.g.
+// inline code inside bold) is stripped too — a single fused alternation would
+// leave the inner delimiters behind.
+var (
+	mdBoldPattern       = regexp.MustCompile(`\*\*([^*]+)\*\*`)
+	mdInlineCodePattern = regexp.MustCompile("`([^`]+)`")
+	mdItalicPattern     = regexp.MustCompile(`\*([^*]+)\*`)
+)
+
 // minLearningLength is the minimum character length for a learning to be valid.
 const minLearningLength = 20
 
+// maxLearningSections bounds how many sections ExtractLearnings tries, newest
+// first. Older sections are stale by definition, and the bound keeps the work
+// independent of how many headers a long output contains.
+const maxLearningSections = 3
+
+// learningScanWindow is how much trailing text ExtractLearnings searches for
+// headers at a time. Windows grow backward only when no section in the
+// current one yields valid learnings.
+const learningScanWindow = 64 << 10
+
 // ExtractLearnings parses structured learning items from text.
 // It looks for sections like "## Key Learnings:" or "## Aprendizajes Clave:"
 // and extracts numbered (1. text) or bullet (- text) items.
-// Returns learnings from the LAST matching section (most recent output).
+// Returns learnings from the LAST matching section (most recent output),
+// falling back to at most maxLearningSections-1 earlier ones.
 func ExtractLearnings(text string) []string {
-	matches := learningHeaderPattern.FindAllStringIndex(text, -1)
-	if len(matches) == 0 {
+	// Every learnings header starts with "##" — skip the regex work entirely
+	// for the common case of output without any such header.
+	if !strings.Contains(text, "##") {
 		return nil
 	}
 
-	// Process sections in reverse — use first valid one (most recent)
-	for i := len(matches) - 1; i >= 0; i-- {
-		sectionStart := matches[i][1]
-		sectionText := text[sectionStart:]
+	// Scan from the tail backward so long outputs whose last section is
+	// valid never have their earlier headers matched at all.
+	tried := 0
+	for end := len(text); end > 0 && tried < maxLearningSections; {
+		start := learningWindowStart(text, end)
+		matches := learningHeaderPattern.FindAllStringIndex(text[start:end], -1)
 
-		// Cut off at next major section header
-		if nextHeader := regexp.MustCompile(`\n#{1,3} `).FindStringIndex(sectionText); nextHeader != nil {
-			sectionText = sectionText[:nextHeader[0]]
-		}
+		// Process sections in reverse — use first valid one (most recent)
+		for i := len(matches) - 1; i >= 0 && tried < maxLearningSections; i-- {
+			sectionStart := start + matches[i][1]
 
-		var learnings []string
+			// On the window's last line, \s*$ can swallow the newline at the
+			// window end — re-match against the full text so $ sees what follows.
+			if sectionStart == end && end < len(text) {
+				headerStart := start + matches[i][0]
+				sectionStart = headerStart + learningHeaderPattern.FindStringIndex(text[headerStart:])[1]
+			}
 
-		// Try numbered items: "1. text" or "1) text"
-		numbered := regexp.MustCompile(`(?m)^\s*\d+[.)]\s+(.+)`).FindAllStringSubmatch(sectionText, -1)
-		if len(numbered) > 0 {
-			for _, m := range numbered {
-				cleaned := cleanMarkdown(m[1])
-				if len(cleaned) >= minLearningLength {
-					learnings = append(learnings, cleaned)
-				}
+			if learnings := learningsFromSection(text, sectionStart); len(learnings) > 0 {
+				return learnings
 			}
+			tried++
 		}
+		end = start
+	}
 
-		// Fall back to bullet items: "- text" or "* text"
-		if len(learnings) == 0 {
-			bullets := regexp.MustCompile(`(?m)^\s*[-*]\s+(.+)`).FindAllStringSubmatch(sectionText, -1)
-			for _, m := range bullets {
-				cleaned := cleanMarkdown(m[1])
-				if len(cleaned) >= minLearningLength {
-					learnings = append(learnings, cleaned)
-				}
-			}
+	return nil
+}
+
+// learningWindowStart returns where the scan window ending at end begins,
+// aligned to a line start so the (?m)^ anchor behaves as on the full text.
+func learningWindowStart(text string, end int) int {
+	start := end - learningScanWindow
+	if start <= 0 {
+		return 0
+	}
+	return strings.LastIndexByte(text[:start], '\n') + 1
+}
+
+// learningsFromSection extracts the valid learning items of the section whose
+// header ends at sectionStart.
+func learningsFromSection(text string, sectionStart int) []string {
+	sectionText := text[sectionStart:]
+
+	// Cut off at next major section header
+	if next := nextSectionIndex(sectionText); next >= 0 {
+		sectionText = sectionText[:next]
+	}
+
+	// Try numbered items: "1. text" or "1) text"
+	learnings := collectLearnings(numberedItemPattern, sectionText)
+
+	// Fall back to bullet items: "- text" or "* text". Sections where no line
+	// starts with a bullet marker skip the regex entirely.
+	if len(learnings) == 0 && hasBulletMarker(sectionText) {
+		learnings = collectLearnings(bulletItemPattern, sectionText)
+	}
+
+	return learnings
+}
+
+// hasBulletMarker reports whether any line of text starts with '-' or '*'
+// after optional leading whitespace — a precondition for bulletItemPattern.
+// A bare substring check is useless here: hyphenated words and dates put a
+// '-' in almost any prose.
+func hasBulletMarker(text string) bool {
+	for i := 0; i < len(text); {
+		// i is at a line start; skip leading whitespace (including blank lines)
+		for i < len(text) && strings.IndexByte(" \t\n\f\r", text[i]) >= 0 {
+			i++
+		}
+		if i < len(text) && (text[i] == '-' || text[i] == '*') {
+			return true
+		}
+		next := strings.IndexByte(text[i:], '\n')
+		if next < 0 {
+			return false
 		}
+		i += next + 1
+	}
+	return false
+}
 
-		if len(learnings) > 0 {
-			return learnings
+// collectLearnings returns the cleaned items matched by pattern that are long
+// enough to be valid learnings. Items are sliced out of text by submatch index
+// so no intermediate []string is allocated per match.
+func collectLearnings(pattern *regexp.Regexp, text string) []string {
+	var learnings []string
+	for _, m := range pattern.FindAllStringSubmatchIndex(text, -1) {
+		cleaned := cleanMarkdown(text[m[2]:m[3]])
+		if len(cleaned) >= minLearningLength {
+			learnings = append(learnings, cleaned)
 		}
 	}
+	return learnings
+}
 
-	return nil
+// nextSectionIndex returns the index of the newline that starts the next
+// major header ("# ", "## " or "### ") in text, or -1 if there is none.
+// A plain substring scan is enough here — no regex needed.
+func nextSectionIndex(text string) int {
+	for i := 0; i < len(text); {
+		j := strings.Index(text[i:], "\n#")
+		if j < 0 {
+			return -1
+		}
+		j += i
+
+		hashes := 0
+		for k := j + 1; k < len(text) && text[k] == '#' && hashes <= 3; k++ {
+			hashes++
+		}
+		if end := j + 1 + hashes; hashes <= 3 && end < len(text) && text[end] == ' ' {
+			return j
+		}
+		i = j + 1
+	}
+	return -1
 }
 
 // cleanMarkdown strips basic markdown formatting and collapses whitespace.
 func cleanMarkdown(text string) string {
-	text = regexp.MustCompile(`\*\*([^*]+)\*\*`).ReplaceAllString(text, "$1") // bold
-	text = regexp.MustCompile("`([^`]+)`").ReplaceAllString(text, "$1")       // inline code
-	text = regexp.MustCompile(`\*([^*]+)\*`).ReplaceAllString(text, "$1")     // italic
+	// Each pass only runs when its delimiter is present, so plain text skips
+	// the regex work entirely.
+	if strings.Contains(text, "**") {
+		text = mdBoldPattern.ReplaceAllString(text, "$1") // bold
+	}
+	if strings.Contains(text, "`") {
+		text = mdInlineCodePattern.ReplaceAllString(text, "$1") // inline code
+	}
+	if strings.Contains(text, "*") {
+		text = mdItalicPattern.ReplaceAllString(text, "$1") // italic
+	}
 	return strings.TrimSpace(strings.Join(strings.Fields(text), " "))
 }
 
 // PassiveCapture extracts learnings from text and saves them as observations.
 // It deduplicates against existing observations using content hash matching.
+// All learnings are written in a single transaction.
 func (s *Store) PassiveCapture(p PassiveCaptureParams) (*PassiveCaptureResult, error) {
 	result := &PassiveCaptureResult{}
 
@@ -1902,11 +2054,17 @@ func (s *Store) PassiveCapture(p PassiveCaptureParams) (*PassiveCaptureResult, e
 		return result, nil
 	}
 
+	tx, err := s.beginTxHook()
+	if err != nil {
+		return result, fmt.Errorf("passive capture: begin tx: %w", err)
+	}
+	defer tx.Rollback()
+
 	for _, learning := range learnings {
 		// Check if this learning already exists (by content hash) within this project
 		normHash := hashNormalized(learning)
 		var existingID int64
-		err := s.db.QueryRow(
+		err := tx.QueryRow(
 			`SELECT id FROM observations
 			 WHERE normalized_hash = ?
 			   AND ifnull(project, '') = ifnull(?, '')
@@ -1921,16 +2079,10 @@ func (s *Store) PassiveCapture(p PassiveCaptureParams) (*PassiveCaptureResult, e
 			continue
 		}
 
-		// Truncate for title: first 60 chars
-		title := learning
-		if len(title) > 60 {
-			title = title[:60] + "..."
-		}
-
-		_, err = s.AddObservation(AddObservationParams{
+		_, err = s.addObservation(tx, AddObservationParams{
 			SessionID: p.SessionID,
 			Type:      "passive",
-			Title:     title,
+			Title:     truncate(learning, 60),
 			Content:   learning,
 			Project:   p.Project,
 			Scope:     "project",
@@ -1942,6 +2094,10 @@ func (s *Store) PassiveCapture(p PassiveCaptureParams) (*PassiveCaptureResult, e
 		result.Saved++
 	}
 
+	if err := s.commitHook(tx); err != nil {
+		return result, fmt.Errorf("passive capture: commit: %w", err)
+	}
+
 	return result, nil
 }
 
@@ -569,6 +569,26 @@ func TestPromptProjectNullScan(t *testing.T) {
 	}
 }
 
+func TestStripPrivateTags(t *testing.T) {
+	tests := []struct {
+		in   string
+		want string
+	}{
+		{in: "  plain content  ", want: "plain content"},
+		{in: "a < b and <b>bold</b>", want: "a < b and <b>bold</b>"},
+		{in: "key <private>sk-123</private> end", want: "key [REDACTED] end"},
+		{in: "key <PRIVATE>sk-123</Private> end", want: "key [REDACTED] end"},
+		{in: "dangling <private> tag", want: "dangling <private> tag"},
+		{in: "ends with <priv", want: "ends with <priv"},
+	}
+
+	for _, tt := range tests {
+		if got := stripPrivateTags(tt.in); got != tt.want {
+			t.Errorf("stripPrivateTags(%q) = %q, want %q", tt.in, got, tt.want)
+		}
+	}
+}
+
 // ─── Passive Capture Tests ───────────────────────────────────────────────────
 
 func TestExtractLearningsNumberedList(t *testing.T) {
@@ -690,6 +710,39 @@ func TestExtractLearningsFallsBackWhenLastSectionHasNoValidItems(t *testing.T) {
 	}
 }
 
+func TestExtractLearningsOnlyTriesRecentSections(t *testing.T) {
+	text := "## Key Learnings:\n\n1. This is long enough but older than the section bound\n\n" +
+		strings.Repeat("## Key Learnings:\n\n1. short\n\n", maxLearningSections)
+	learnings := ExtractLearnings(text)
+	if len(learnings) != 0 {
+		t.Fatalf("expected sections beyond the bound to be ignored, got %d: %v", len(learnings), learnings)
+	}
+}
+
+func TestExtractLearningsFallsBackAcrossScanWindows(t *testing.T) {
+	filler := strings.Repeat("unrelated transcript output line\n", (2*learningScanWindow)/32)
+	text := "## Key Learnings:\n\n1. This is long enough and lives far before the scan window\n\n" +
+		filler +
+		"## Key Learnings:\n\n1. short\n"
+	learnings := ExtractLearnings(text)
+	if len(learnings) != 1 {
+		t.Fatalf("expected fallback to section in earlier window, got %d: %v", len(learnings), learnings)
+	}
+	if !strings.Contains(learnings[0], "far before") {
+		t.Fatalf("expected learning from earlier window, got %q", learnings[0])
+	}
+}
+
+func TestExtractLearningsHeaderOnScanWindowBoundary(t *testing.T) {
+	tail := "# Unrelated notes\n* this bullet belongs to another section entirely\n"
+	tail += strings.Repeat("x", learningScanWindow-len(tail)-1) + "\n"
+	text := "intro\n## Key Learnings:\n" + tail
+
+	if learnings := ExtractLearnings(text); len(learnings) != 0 {
+		t.Fatalf("expected header on window boundary to keep its empty section, got %v", learnings)
+	}
+}
+
 func TestExtractLearningsCleansMarkdown(t *testing.T) {
 	text := "## Key Learnings:\n\n1. **Use** `context.Context` in *all* handlers to support cancellation correctly\n"
 	learnings := ExtractLearnings(text)
@@ -701,6 +754,69 @@ func TestExtractLearningsCleansMarkdown(t *testing.T) {
 	}
 }
 
+func TestNextSectionIndex(t *testing.T) {
+	tests := []struct {
+		text string
+		want int
+	}{
+		{text: "\n1. item\n## Next", want: 8},
+		{text: "\n1. item\n# Next", want: 8},
+		{text: "\n1. item\n### Next", want: 8},
+		{text: "\n1. item\n#### Deep\n## Next", want: 18},
+		{text: "\n1. item\n#hashtag\n", want: -1},
+		{text: "\n1. item #1 ## not a header", want: -1},
+		{text: "\n1. item\n##", want: -1},
+		{text: "", want: -1},
+	}
+
+	for _, tt := range tests {
+		if got := nextSectionIndex(tt.text); got != tt.want {
+			t.Errorf("nextSectionIndex(%q) = %d, want %d", tt.text, got, tt.want)
+		}
+	}
+}
+
+func TestHasBulletMarker(t *testing.T) {
+	tests := []struct {
+		text string
+		want bool
+	}{
+		{text: "- item", want: true},
+		{text: "\n\n  * item", want: true},
+		{text: "intro\n\t- item", want: true},
+		{text: "a well-known trade-off noted on 2024-01-02", want: false},
+		{text: "no *emphasis* markers at line start\nnor here - really", want: false},
+		{text: "", want: false},
+	}
+	for _, tt := range tests {
+		if got := hasBulletMarker(tt.text); got != tt.want {
+			t.Fatalf("hasBulletMarker(%q) = %v, want %v", tt.text, got, tt.want)
+		}
+	}
+}
+
+func TestCleanMarkdownStripsMixedFormatting(t *testing.T) {
+	got := cleanMarkdown("  **Bold**   then `code`\n and *italic*   text ")
+	if got != "Bold then code and italic text" {
+		t.Fatalf("unexpected cleaned text: %q", got)
+	}
+}
+
+func TestCleanMarkdownStripsNestedSpans(t *testing.T) {
+	tests := map[string]string{
+		"`a*b*c`":                  "abc",
+		"*wrap `ctx` always*":      "wrap ctx always",
+		"**bold `code` here**":     "bold code here",
+		"**Use `ctx`** everywhere": "Use ctx everywhere",
+		"Use *`ctx`* here":         "Use ctx here",
+	}
+	for in, want := range tests {
+		if got := cleanMarkdown(in); got != want {
+			t.Fatalf("cleanMarkdown(%q) = %q, want %q", in, got, want)
+		}
+	}
+}
+
 func TestPassiveCaptureStoresLearnings(t *testing.T) {
 	s := newTestStore(t)
 
@@ -831,6 +947,40 @@ func TestPassiveCaptureReturnsErrorWhenSessionDoesNotExist(t *testing.T) {
 	}
 }
 
+func TestPassiveCaptureWritesLearningsInOneTransaction(t *testing.T) {
+	s := newTestStore(t)
+
+	if err := s.CreateSession("s1", "engram", "/tmp/engram"); err != nil {
+		t.Fatalf("create session: %v", err)
+	}
+
+	s.hooks.commit = func(_ *sql.Tx) error {
+		return errors.New("forced passive commit failure")
+	}
+
+	_, err := s.PassiveCapture(PassiveCaptureParams{
+		SessionID: "s1",
+		Content: `## Key Learnings:
+
+1. bcrypt cost=12 is the right balance for our server performance
+2. JWT refresh tokens need atomic rotation to prevent race conditions
+`,
+		Project: "engram",
+		Source:  "test",
+	})
+	if err == nil || !strings.Contains(err.Error(), "forced passive commit failure") {
+		t.Fatalf("expected commit failure, got %v", err)
+	}
+
+	obs, err := s.AllObservations("engram", "", 10)
+	if err != nil {
+		t.Fatalf("all observations: %v", err)
+	}
+	if len(obs) != 0 {
+		t.Fatalf("expected no observations after failed commit, got %d", len(obs))
+	}
+}
+
 func TestStatsProjectsOrderedByMostRecentObservation(t *testing.T) {
 	s := newTestStore(t)
 
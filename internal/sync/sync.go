@@ -25,6 +25,7 @@ import (
 	"encoding/hex"
 	"encoding/json"
 	"fmt"
+	"io"
 	"os"
 	"path/filepath"
 	"sort"
@@ -413,10 +414,13 @@ func filterByProject(data *store.ExportData, project string) *store.ExportData {
 }
 
 // normalizeTime converts various time formats to a comparable string.
+// It runs once per exported row, so DB timestamps skip time.Parse entirely.
 func normalizeTime(t string) string {
-	// Try RFC3339 first
-	if parsed, err := time.Parse(time.RFC3339, t); err == nil {
-		return parsed.UTC().Format("2006-01-02 15:04:05")
+	// Only RFC3339 timestamps (with the 'T' separator) need parsing
+	if len(t) > 10 && t[10] == 'T' {
+		if parsed, err := time.Parse(time.RFC3339, t); err == nil {
+			return parsed.UTC().Format("2006-01-02 15:04:05")
+		}
 	}
 	// Already in "2006-01-02 15:04:05" format
 	return strings.TrimSpace(t)
@@ -451,18 +455,9 @@ func readGzip(path string) ([]byte, error) {
 	}
 	defer gz.Close()
 
-	var buf strings.Builder
-	data := make([]byte, 4096)
-	for {
-		n, err := gz.Read(data)
-		if n > 0 {
-			buf.Write(data[:n])
-		}
-		if err != nil {
-			break
-		}
-	}
-	return []byte(buf.String()), nil
+	// Read straight into a byte slice for json.Unmarshal — no intermediate
+	// string copy of the decompressed chunk.
+	return io.ReadAll(gz)
 }
 
 // ─── Helpers ─────────────────────────────────────────────────────────────────
@@ -0,0 +1,39 @@
+#!/bin/bash
+# Engram — shared helpers for the Claude Code hook scripts
+#
+# Sourced by the hooks, not run directly.
+
+# Talk to the server over its Unix socket when it exposes one (ENGRAM_SOCKET)
+CURL_SOCKET=()
+if [ -n "$ENGRAM_SOCKET" ] && [ -S "$ENGRAM_SOCKET" ]; then
+  CURL_SOCKET=(--unix-socket "$ENGRAM_SOCKET")
+fi
+
+# Run curl against the server, over CURL_SOCKET when set (also after every
+# --next). A socket that refuses the connection (curl exit 7) may be a stale
+# file left by a server that is gone, so retry once over TCP. The request
+# body must not come from stdin — a retry cannot replay it.
+engram_curl() {
+  if [ ${#CURL_SOCKET[@]} -gt 0 ]; then
+    local args=("${CURL_SOCKET[@]}") arg status
+    for arg in "$@"; do
+      args+=("$arg")
+      [ "$arg" = "--next" ] && args+=("${CURL_SOCKET[@]}")
+    done
+    curl "${args[@]}"
+    status=$?
+    [ $status -ne 7 ] && return $status
+  fi
+  curl "$@"
+}
+
+# Read hook input from stdin, giving up after 2 seconds so a stdin that is
+# never closed cannot stall the hook.
+read_stdin() {
+  cat <&0 &
+  local reader=$!
+  ( sleep 2; kill "$reader" 2>/dev/null ) > /dev/null 2>&1 &
+  local watchdog=$!
+  wait "$reader"
+  kill "$watchdog" 2>/dev/null
+}
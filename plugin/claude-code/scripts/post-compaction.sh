@@ -7,23 +7,27 @@
 ENGRAM_PORT="${ENGRAM_PORT:-7437}"
 ENGRAM_URL="http://127.0.0.1:${ENGRAM_PORT}"
 
-# Read hook input from stdin
-INPUT=$(cat)
+# Shared helpers: read_stdin, engram_curl
+source "$(dirname "$0")/common.sh"
+
+INPUT=$(read_stdin)
 SESSION_ID=$(echo "$INPUT" | jq -r '.session_id // empty')
 CWD=$(echo "$INPUT" | jq -r '.cwd // empty')
 PROJECT=$(basename "$CWD")
 
-# Ensure session exists
+# Ensure the session exists and fetch context from previous sessions in a
+# single curl invocation so both requests share one keep-alive connection.
+CURL_ARGS=()
 if [ -n "$SESSION_ID" ] && [ -n "$PROJECT" ]; then
-  curl -sf "${ENGRAM_URL}/sessions" \
+  CURL_ARGS+=(-sf "${ENGRAM_URL}/sessions" \
     -X POST \
     -H "Content-Type: application/json" \
     -d "{\"id\":\"${SESSION_ID}\",\"project\":\"${PROJECT}\",\"directory\":\"${CWD}\"}" \
-    > /dev/null 2>&1
+    -o /dev/null \
+    --next)
 fi
-
-# Fetch context from previous sessions
-CONTEXT=$(curl -sf "${ENGRAM_URL}/context?project=${PROJECT}" --max-time 3 2>/dev/null | jq -r '.context // empty')
+CURL_ARGS+=(-sf "${ENGRAM_URL}/context?project=${PROJECT}" --max-time 3)
+CONTEXT=$(engram_curl "${CURL_ARGS[@]}" 2>/dev/null | jq -r '.context // empty')
 
 # Inject Memory Protocol + compaction instruction + context
 cat <<PROTOCOL
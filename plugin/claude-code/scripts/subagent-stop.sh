@@ -8,26 +8,63 @@
 ENGRAM_PORT="${ENGRAM_PORT:-7437}"
 ENGRAM_URL="http://127.0.0.1:${ENGRAM_PORT}"
 
-# Read hook input from stdin
-INPUT=$(cat)
-SESSION_ID=$(echo "$INPUT" | jq -r '.session_id // empty')
-CWD=$(echo "$INPUT" | jq -r '.cwd // empty')
-OUTPUT=$(echo "$INPUT" | jq -r '.stdout // empty')
-PROJECT=$(basename "$CWD")
+# Shared helpers: read_stdin, CURL_SOCKET
+source "$(dirname "$0")/common.sh"
+
+# Build the request body from the hook input in a single jq pass — stdin is
+# parsed once and the resulting body is later sent with --data-binary @-.
+# Empty output yields no payload.
+PAYLOAD=$(read_stdin | jq -c \
+  --arg source "subagent-stop" \
+  'select((.stdout // "") != "")
+   | {session_id: (.session_id // ""),
+      content: .stdout,
+      project: ((.cwd // "") | sub("/+$"; "") | split("/") | last // ""),
+      source: $source}')
 
 # Nothing to capture if no output
-[ -z "$OUTPUT" ] && exit 0
-
-# Fire and forget — server handles extraction, dedup, and storage
-curl -sf "${ENGRAM_URL}/observations/passive" \
-  -X POST \
-  -H "Content-Type: application/json" \
-  -d "$(jq -n \
-    --arg sid "$SESSION_ID" \
-    --arg content "$OUTPUT" \
-    --arg project "$PROJECT" \
-    --arg source "subagent-stop" \
-    '{session_id: $sid, content: $content, project: $project, source: $source}')" \
-  > /dev/null 2>&1
+[ -z "$PAYLOAD" ] && exit 0
+
+# Duplicate SubagentStop events (retries, re-fires) carry the exact same
+# payload. Remember checksums of recently sent payloads and skip repeats.
+ENGRAM_DATA_DIR="${ENGRAM_DATA_DIR:-$HOME/.engram}"
+SENT_FILE="${ENGRAM_DATA_DIR}/subagent-stop.sent"
+CHECKSUM=$(printf '%s' "$PAYLOAD" | cksum)
+grep -qxF "$CHECKSUM" "$SENT_FILE" 2>/dev/null && exit 0
+
+post_capture() {
+  printf '%s' "$PAYLOAD" | curl "${CURL_SOCKET[@]}" -sf "${ENGRAM_URL}/observations/passive" \
+    -X POST \
+    -H "Content-Type: application/json" \
+    --data-binary @- \
+    > /dev/null 2>&1
+}
+
+# Fire and forget — server handles extraction, dedup, and storage.
+# The payload is piped on stdin, so engram_curl cannot replay it; a socket
+# that refuses the connection is retried over TCP here instead.
+post_capture
+STATUS=$?
+if [ $STATUS -eq 7 ] && [ ${#CURL_SOCKET[@]} -gt 0 ]; then
+  CURL_SOCKET=()
+  post_capture
+  STATUS=$?
+fi
+
+# If the server is down (curl exit 7: connection refused), start it so this
+# and every later capture hits one long-lived process, then retry once.
+if [ $STATUS -eq 7 ]; then
+  engram serve &>/dev/null &
+  sleep 0.5
+  post_capture
+  STATUS=$?
+fi
+
+# Only remember payloads the server actually accepted (keep the last 50)
+if [ $STATUS -eq 0 ] && SENT_TMP=$(mktemp "${SENT_FILE}.XXXXXX" 2>/dev/null); then
+  { tail -n 49 "$SENT_FILE" 2>/dev/null; echo "$CHECKSUM"; } > "$SENT_TMP" \
+    && mv -f "$SENT_TMP" "$SENT_FILE" 2>/dev/null \
+    || rm -f "$SENT_TMP"
+fi
 
 exit 0